@@ -1,7 +1,5 @@
 import nltk
-nltk.download('punkt_tab')
 from nltk.tokenize import word_tokenize
-from nltk.probability import FreqDist
 from nltk.stem import PorterStemmer
 from nltk.stem.wordnet import WordNetLemmatizer
 from utils import *
@@ -12,245 +10,271 @@ from api_keys import polygon_api_key, serpapi_api_key
 from polygon.rest import RESTClient
 from finvizfinance.quote import finvizfinance
 import serpapi
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from collections import Counter
+from itertools import chain
+from functools import lru_cache
+import os
+import re
+import soupsieve as sv
+from dataclasses import dataclass
+
+try:
+    from blingfire import text_to_words
+
+    _HAVE_BLINGFIRE = True
+except Exception:
+    _HAVE_BLINGFIRE = False
+
+try:
+    from lightlemma import lemmatize as _light_lemmatize
+
+    _HAVE_LIGHTLEMMA = True
+except Exception:
+    _HAVE_LIGHTLEMMA = False
 pd.options.display.max_colwidth = 100
 
 
-class NewsImporter:
-    def __init__(self):
-        self.link_titles_src1 = []
-        self.link_titles_src1_for_df = []
-        self.link_titles_src2 = []
-        self.link_titles_src2_for_df = []
-        self.link_titles_src3 = []
-        self.link_titles_src3_for_df = []
-        self.link_titles_src4 = []
-        self.link_titles_src4_for_df = []
-        self.link_titles_src5 = []
-        self.link_titles_src5_for_df = []
-        self.link_titles_src6 = []
-        self.link_titles_src6_for_df = []
-        self.link_titles_src7 = []
-        self.link_titles_src7_for_df = []
-        self.link_titles_src8 = []
-        self.link_titles_src8_for_df = []
-        self.link_titles_src9 = []
-        self.link_titles_src9_for_df = []
-        self.link_titles_src10 = []
-        self.link_titles_src10_for_df = []
-        self.link_titles_src11 = []
-        self.link_titles_src11_for_df = []
-        self.link_titles_src12 = []
-        self.link_titles_src12_for_df = []
-        self.link_titles_src13 = []
-        self.link_titles_src13_for_df = []
-        self.link_titles_all = []
-        self.links_for_df = []
-        self.links_df = []
-        self.tokenized_word = []
-        self.filtered_words = []
-        self.stop_words_file = []
-        self.stop_words_edited = []
-        self.ps = []
-        self.stemmed_words = []
-        self.lem = []
-        self.lemmed_words = []
-        self.fdist_stem = []
-        self.fdist_stem_dict = []
-        self.fdist_lem = []
-        self.fdist_lem_dict = []
-        self.bigrams_lemmed = []
-        self.bigrams_stemmed = []
-        self.fdist_bigrams_lemmed = []
-        self.fdist_bigrams_lemmed_dict = []
-        self.fdist_bigrams_stemmed = []
-        self.fdist_bigrams_stemmed_dict = []
-        self.bigrams_lemmed_dict = []
-        self.bi_stem = []
-        self.bi_lem = []
-        self.trigrams_lemmed = []
-        self.trigrams_stemmed = []
-        self.fdist_trigrams_lemmed = []
-        self.fdist_trigrams_lemmed_dict = []
-        self.fdist_trigrams_stemmed = []
-        self.fdist_trigrams_stemmed_dict = []
-        self.trigrams_lemmed_dict = []
-        self.tri_lem = []
-        self.tri_stem = []
-        self.link_titles_all_set = []
-        self.polarity_scores = []
-        self.headlines = []
-    
-    def frontpage_headlines(self, clean_headlines: bool = True):
-        #src1 news scraper
-        source = src1
-        soup = basic_bsoup(source)
-        containers = soup.findAll("a", {"class" : "nn-tab-link"})
-        self.link_titles_src1 = []
-        self.link_titles_src1_for_df = []
-        for container in containers:
-            self.link_titles_src1.append(container.contents)
-            self.link_titles_src1_for_df.append((str(container.string), container['href'], 'src1'))
-        flatten_list(self.link_titles_src1)
-        self.link_titles_src1 = []
-        for element in flatten_list.flattened:
-            self.link_titles_src1.append(element.strip())   
-        ###############################################################################
+STOPWORDS_PATH = r"C:\Users\jdejo\OneDrive\Documents\Python_Folders\News_Web_Scraper\stopwords.txt"
+#path -> (mtime, stopwords) for load_stopwords().
+_stopwords_cache: dict = {}
 
-        ###############################################################################
-        #src2 News scraper 
-        source = src2
-        soup = basic_bsoup(source)
-        containers = soup.findAll("a", {"class" : "Card-title"})
-        self.link_titles_src2 = []
-        self.link_titles_src2_for_df = []
-        for container in containers:
-            self.link_titles_src2.append(container.string)
-            self.link_titles_src2_for_df.append((str(container.string), container['href'], 'src2 Business'))
-        Not_none_values = filter(None.__ne__, self.link_titles_src2)
-        self.link_titles_src2 = list(Not_none_values)
-        ###############################################################################
 
-        ###############################################################################
-        #src3 News scraper
-        source = src3
-        soup = basic_bsoup(source)
-        containers = soup.findAll("a", {"class" : "Card-title"})
-        self.link_titles_src3 = []
-        self.link_titles_src3_for_df = []
-        for container in containers:
-            self.link_titles_src3.append(container.string)
-            self.link_titles_src3_for_df.append((str(container.string), container['href'], 'src3 Economy'))
-        Not_none_values = filter(None.__ne__, self.link_titles_src3)
-        self.link_titles_src3 = list(Not_none_values)
-        ###############################################################################
+def load_stopwords(path: str = STOPWORDS_PATH) -> frozenset:
+    """
+    Return the stopwords in `path` as a frozenset (a hash lookup per token instead of a list scan).
 
-        ###############################################################################
-        #src4 News scraper
-        source = src4
-        soup = basic_bsoup(source)
-        containers = soup.findAll("a", {"class" : "Card-title"})
-        self.link_titles_src4 = []
-        self.link_titles_src4_for_df = []
-        for container in containers:
-            self.link_titles_src4.append(container.string)
-            self.link_titles_src4_for_df.append((str(container.string), container['href'], 'src4 Finance'))
-        Not_none_values = filter(None.__ne__, self.link_titles_src4)
-        self.link_titles_src4 = list(Not_none_values)
-        ###############################################################################
+    The parsed set is kept for the life of the process and only re-read when the file's
+    mtime changes, so repeated process_headlines() calls skip the file entirely.
+    """
+    mtime = os.path.getmtime(path)
+    cached = _stopwords_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, "r") as stop_words_file:
+            cached = (mtime, frozenset(line.rstrip("\r\n") for line in stop_words_file))
+        _stopwords_cache[path] = cached
+    return cached[1]
 
-        ###############################################################################
-        #src5 News scraper
-        source = src5
-        soup = basic_bsoup(source)
-        containers = soup.findAll("a", {"class" : "Card-title"})
-        self.link_titles_src5 = []
-        self.link_titles_src5_for_df = []
-        for container in containers:
-            self.link_titles_src5.append(container.string)
-            self.link_titles_src5_for_df.append((str(container.string), container['href'], 'src5 Health and Science'))
-        Not_none_values = filter(None.__ne__, self.link_titles_src5)
-        self.link_titles_src5 = list(Not_none_values)
-        ###############################################################################
 
-        ###############################################################################
-        #src6 News scraper
-        source = src6
-        soup = basic_bsoup(source)
-        containers = soup.findAll("a", {"class" : "Card-title"})
-        self.link_titles_src6 = []
-        self.link_titles_src6_for_df = []
-        for container in containers:
-            self.link_titles_src6.append(container.string)
-            self.link_titles_src6_for_df.append((str(container.string), container['href'], 'src6 Real Estate'))
-        Not_none_values = filter(None.__ne__, self.link_titles_src6)
-        self.link_titles_src6 = list(Not_none_values)
-        ###############################################################################
+_STEMMER = PorterStemmer()
+_LEMMATIZER = WordNetLemmatizer()
 
-        ###############################################################################
-        #src7 News scraper
-        source = src7
-        soup = basic_bsoup(source)
-        containers = soup.findAll("a", {"class" : "Card-title"})
-        self.link_titles_src7 = []
-        self.link_titles_src7_for_df = []
-        for container in containers:
-            self.link_titles_src7.append(container.string)
-            self.link_titles_src7_for_df.append((str(container.string), container['href'], 'src7 Energy'))
-        Not_none_values = filter(None.__ne__, self.link_titles_src7)
-        self.link_titles_src7 = list(Not_none_values)
-        ###############################################################################
 
-        ###############################################################################
-        #src8 News scraper
-        source = src8
-        soup = basic_bsoup(source)
-        containers = soup.findAll("a", {"class" : "Card-title"})
-        self.link_titles_src8 = []
-        self.link_titles_src8_for_df = []
-        for container in containers:
-            self.link_titles_src8.append(container.string)
-            self.link_titles_src8_for_df.append((str(container.string), container['href'], 'src8 Transportation'))
-        Not_none_values = filter(None.__ne__, self.link_titles_src8)
-        self.link_titles_src8 = list(Not_none_values)
-        ###############################################################################
+#Headline vocabulary is small and Zipf-distributed, so these caches stay warm across process_headlines() runs.
+@lru_cache(maxsize=65536)
+def stem_word(word: str) -> str:
+    """PorterStemmer.stem, memoized."""
+    return _STEMMER.stem(word)
 
-        ###############################################################################
-        #src9 News scraper
-        source = src9
-        soup = basic_bsoup(source)
-        containers = soup.findAll("a", {"class" : "Card-title"})
-        self.link_titles_src9 = []
-        self.link_titles_src9_for_df = []
-        for container in containers:
-            self.link_titles_src9.append(container.string)
-            self.link_titles_src9_for_df.append((str(container.string), container['href'], 'src9 Industrials'))
-        Not_none_values = filter(None.__ne__, self.link_titles_src9)
-        self.link_titles_src9 = list(Not_none_values)
-        ###############################################################################
 
-        ###############################################################################
-        #src10 News scraper
-        source = src10
-        soup = basic_bsoup(source)
-        containers = soup.findAll("a", {"class" : "Card-title"})
-        self.link_titles_src10 = []
-        self.link_titles_src10_for_df = []
-        for container in containers:
-            self.link_titles_src10.append(container.string)
-            self.link_titles_src10_for_df.append((str(container.string), container['href'], 'src10 Retail'))
-        Not_none_values = filter(None.__ne__, self.link_titles_src10)
-        self.link_titles_src10 = list(Not_none_values)
+@lru_cache(maxsize=65536)
+def lemmatize_word(word: str) -> str:
+    """
+    Lemmatize `word`, memoized.
+
+    Uses LightLemma when installed (rule-based, never loads the WordNet corpus),
+    otherwise WordNetLemmatizer.lemmatize.
+    """
+    if _HAVE_LIGHTLEMMA:
+        return _light_lemmatize(word)
+    return _LEMMATIZER.lemmatize(word)
+
+
+@lru_cache(maxsize=None)
+def sentiment_analyzer() -> SentimentIntensityAnalyzer:
+    """Shared VADER analyzer; building one re-reads the lexicon file, so it's done once per process."""
+    return SentimentIntensityAnalyzer()
+
+
+@lru_cache(maxsize=65536)
+def _cached_polarity(headline: str) -> tuple:
+    """VADER polarity_scores for `headline` as immutable (key, score) pairs, memoized across runs."""
+    return tuple(sentiment_analyzer().polarity_scores(headline).items())
+
+
+def headline_polarity(headline: str) -> dict:
+    """VADER polarity_scores for `headline`; a fresh dict per call, so callers may modify it."""
+    return dict(_cached_polarity(headline))
+
+
+#Distinct headlines needed before VADER scoring is spread over worker processes; below this,
+#process start-up (a fresh interpreter importing this module on Windows) costs more than it saves.
+PARALLEL_SENTIMENT_MIN_HEADLINES = 5000
+
+
+def _score_headline_batch(headlines: list[str]) -> list[dict]:
+    """Worker for ProcessPoolExecutor: score a batch with this process's own analyzer."""
+    analyzer = sentiment_analyzer()
+    return [analyzer.polarity_scores(headline) for headline in headlines]
+
+
+def score_headlines(headlines: list[str]) -> dict:
+    """
+    Return {headline: VADER scores} for distinct `headlines`.
+
+    Large batches are split across a ProcessPoolExecutor (VADER is pure Python and
+    CPU-bound); smaller ones use the memoized headline_polarity().
+    """
+    if len(headlines) < PARALLEL_SENTIMENT_MIN_HEADLINES:
+        return {headline: headline_polarity(headline) for headline in headlines}
+    workers = os.cpu_count() or 1
+    size = -(-len(headlines) // workers)
+    batches = [headlines[i:i + size] for i in range(0, len(headlines), size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        scores = [score for batch in executor.map(_score_headline_batch, batches) for score in batch]
+    return dict(zip(headlines, scores))
+
+
+def ngram_counts(words: list[str], n: int) -> Counter:
+    """Count the n-grams of `words`, streaming the zipped tuples straight into a Counter."""
+    return Counter(zip(*(words[i:] for i in range(n))))
+
+
+def frequent_ngrams(counts: Counter, min_count: int = 4) -> dict:
+    """Keep the n-grams seen at least `min_count` times."""
+    return {key: val for key, val in counts.items() if val >= min_count}
+
+
+#CSS selectors compiled once at import; each scrape matches with them directly.
+SEL_NN_TAB_LINK = sv.compile("a.nn-tab-link")
+SEL_CARD_TITLE = sv.compile("a.Card-title")
+SEL_HREF_ANCHOR = sv.compile("a[href]")
+SEL_CARD_TITLE_TEXT = sv.compile("span.card__title-text")
+
+
+@dataclass(frozen=True)
+class SourceSpec:
+    """A front-page source scraped by matching `selector` and reading each link's text."""
+    name: str
+    selector: sv.SoupSieve
+    label: str
+
+
+#Sources whose headlines are the text of every matching link (src11-src13 need their own handling).
+LINK_TEXT_SOURCES = (
+    SourceSpec('src1', SEL_NN_TAB_LINK, 'src1'),
+    SourceSpec('src2', SEL_CARD_TITLE, 'src2 Business'),
+    SourceSpec('src3', SEL_CARD_TITLE, 'src3 Economy'),
+    SourceSpec('src4', SEL_CARD_TITLE, 'src4 Finance'),
+    SourceSpec('src5', SEL_CARD_TITLE, 'src5 Health and Science'),
+    SourceSpec('src6', SEL_CARD_TITLE, 'src6 Real Estate'),
+    SourceSpec('src7', SEL_CARD_TITLE, 'src7 Energy'),
+    SourceSpec('src8', SEL_CARD_TITLE, 'src8 Transportation'),
+    SourceSpec('src9', SEL_CARD_TITLE, 'src9 Industrials'),
+    SourceSpec('src10', SEL_CARD_TITLE, 'src10 Retail'),
+)
+
+
+def text_and_containers(containers):
+    """
+    Yield (text, container) for containers with non-empty text.
+
+    get_text() also reads links whose title is split across nested tags, where
+    `.string` is None.
+    """
+    for container in containers:
+        text = container.get_text(" ", strip=True)
+        if text:
+            yield text, container
+
+
+@lru_cache(maxsize=None)
+def _ensure_nltk_data() -> None:
+    """Download the punkt_tab tokenizer data once, and only if it isn't installed (no network on import)."""
+    try:
+        nltk.data.find('tokenizers/punkt_tab')
+    except LookupError:
+        nltk.download('punkt_tab', quiet=True)
+
+
+#Words, numbers and contractions; punctuation is dropped rather than emitted as tokens.
+_TOKEN_RE = re.compile(r"[A-Za-z0-9']+")
+
+
+def tokenize_headlines(text: str, method: str = "regex") -> list[str]:
+    """
+    Split text into word tokens.
+
+    method:
+        "regex": compiled-regex tokens (fast; no sentence splitting or punctuation tokens).
+        "word": word_tokenize-style tokens, via BlingFire if installed, else NLTK's word_tokenize.
+    """
+    if method == "regex":
+        return _TOKEN_RE.findall(text)
+    if method != "word":
+        raise ValueError(f"Unknown tokenizer method: {method}")
+    if _HAVE_BLINGFIRE:
+        return text_to_words(text).split()
+    _ensure_nltk_data()
+    return word_tokenize(text)
+
+
+class NewsImporter:
+    #Known attributes live in slots; '__dict__' keeps ad-hoc attributes (e.g. set from notebooks) working,
+    #and the dict is only allocated once one is set.
+    __slots__ = (
+        '__dict__',
+        *(f"link_titles_src{i}{suffix}" for i in range(1, 14) for suffix in ("", "_for_df")),
+        'link_titles_all', 'links_for_df', 'links_df',
+        'tokenized_word', 'filtered_words', 'stop_words_file', 'stop_words_edited',
+        'ps', 'stemmed_words', 'lem', 'lemmed_words',
+        'fdist_stem', 'fdist_stem_dict', 'fdist_lem', 'fdist_lem_dict',
+        'fdist_bigrams_lemmed', 'fdist_bigrams_lemmed_dict',
+        'fdist_bigrams_stemmed', 'fdist_bigrams_stemmed_dict',
+        'bigrams_lemmed_dict', 'bigrams_stemmed_dict',
+        'fdist_trigrams_lemmed', 'fdist_trigrams_lemmed_dict',
+        'fdist_trigrams_stemmed', 'fdist_trigrams_stemmed_dict',
+        'trigrams_lemmed_dict', 'trigrams_stemmed_dict',
+        'link_titles_all_set', 'link_titles_all_lower',
+        'sia', 'polarity_scores', 'headlines',
+    )
+
+    def __init__(self):
+        #Every attribute starts as an empty list until frontpage_headlines/process_headlines fill it.
+        for name in NewsImporter.__slots__[1:]:
+            setattr(self, name, [])
+
+    def __setstate__(self, state):
+        #Pickles from before __slots__ hold a plain attribute dict; newer ones a (__dict__, slots) pair.
+        #Start from the __init__ defaults so attributes added since the pickle was made still exist.
+        NewsImporter.__init__(self)
+        if isinstance(state, tuple):
+            inst_dict, slot_state = state
+            state = {**(inst_dict or {}), **(slot_state or {})}
+        for name, value in state.items():
+            setattr(self, name, value)
+    
+    def frontpage_headlines(self, clean_headlines: bool = True):
+        #Fetch every source page concurrently (each one is a network round-trip); the blocks below only parse.
+        sources = {
+            'src1': src1, 'src2': src2, 'src3': src3, 'src4': src4, 'src5': src5,
+            'src6': src6, 'src7': src7, 'src8': src8, 'src9': src9, 'src10': src10,
+            'src11': src11, 'src12': src12, 'src13': src13,
+        }
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            soups = dict(zip(sources, executor.map(basic_bsoup, sources.values())))
+
+        #src1-src10 scrapers: the text of every link matching the source's selector is a headline.
+        for spec in LINK_TEXT_SOURCES:
+            rows = [(title, container['href'], spec.label) for title, container in text_and_containers(spec.selector.select(soups[spec.name]))]
+            setattr(self, f"link_titles_{spec.name}_for_df", rows)
+            setattr(self, f"link_titles_{spec.name}", [item[0] for item in rows])
         ###############################################################################
 
         ###############################################################################
         #src11 News scraper
         #The beginning and end of this may be able to be trimmed-2/11/22
-        source = src11
-        soup = basic_bsoup(source)
-        containers = soup.findAll("a")
-        self.link_titles_src11 = []
-        self.link_titles_src11_for_df = []
-        for container in containers:
-            try:
-                self.link_titles_src11.append(container.string)
-                if container.string == None:
-                    continue
-                self.link_titles_src11_for_df.append((str(container.string), container['href'], 'src11'))
-            except KeyError as ke:
-                continue
-        Not_none_values = filter(None.__ne__, self.link_titles_src11)
-        list_not_none_values = list(Not_none_values)
-        self.link_titles_src11 = []
-        for item in list_not_none_values:
-            if len(item.split()) > 3:
-                self.link_titles_src11.append(item)
+        soup = soups['src11']
+        #Only anchors that have an href and a single text string; no KeyError handling needed.
+        containers = SEL_HREF_ANCHOR.select(soup)
+        self.link_titles_src11_for_df = [(str(container.string), container['href'], 'src11') for container in containers if container.string is not None]
+        self.link_titles_src11 = [item[0] for item in self.link_titles_src11_for_df if len(item[0].split()) > 3]
         ###############################################################################
 
         ###############################################################################
         #src12 News scraper
-        source = src12
-        soup = basic_bsoup(source)
-        containers = soup.findAll("span", {"class" : "card__title-text"})
+        soup = soups['src12']
+        containers = SEL_CARD_TITLE_TEXT.select(soup)
         self.link_titles_src12 = []
         self.link_titles_src12_for_df = []
         for container in containers:
@@ -266,120 +290,101 @@ class NewsImporter:
         ###############################################################################
         #src13 News scraper
         #There may be other pages at this site that could be scraped.
-        source = src13
-        soup = basic_bsoup(source)
-        containers = soup.findAll("a")
-        self.link_titles_src13 = []
-        self.link_titles_src13_for_df = []
-        for container in containers:
-            try:#A picture was in a container and didn't have an 'href' tag. I added the try/except block and it looks like it's working normally now. I tried to handle the KeyError 'href' but it didn't work. I may be able to remove the try/except block in the future if the picture is removed from the site. 
-                self.link_titles_src13.append(container.string)
-                self.link_titles_src13_for_df.append((str(container.string), container['href'], 'src13'))
-            except:
-                continue
-        Not_none_values = filter(None.__ne__, self.link_titles_src13)
-        list_not_none_values = list(Not_none_values)
-        self.link_titles_src13 = []
-        for item in list_not_none_values:
-            if len(item.split()) > 3:
-                self.link_titles_src13.append(item)
+        soup = soups['src13']
+        #a[href] skips anchors without an href (e.g. a picture container), which used to need a try/except.
+        containers = SEL_HREF_ANCHOR.select(soup)
+        self.link_titles_src13_for_df = [(str(container.string), container['href'], 'src13') for container in containers if container.string is not None]
+        self.link_titles_src13 = [item[0] for item in self.link_titles_src13_for_df if len(item[0].split()) > 3]
         ###############################################################################
 
         ###############################################################################
         ###############################################################################
         #List of all link titles
-        self.link_titles_all = self.link_titles_src2 + self.link_titles_src3 + \
-                        self.link_titles_src7 + self.link_titles_src4 + \
-                        self.link_titles_src5 + self.link_titles_src9 + \
-                        self.link_titles_src6 + self.link_titles_src10 + \
-                        self.link_titles_src8 + self.link_titles_src1 + \
-                        self.link_titles_src11 + self.link_titles_src13 + \
-                        self.link_titles_src12
+        self.link_titles_all = list(chain.from_iterable([
+                        self.link_titles_src2, self.link_titles_src3,
+                        self.link_titles_src7, self.link_titles_src4,
+                        self.link_titles_src5, self.link_titles_src9,
+                        self.link_titles_src6, self.link_titles_src10,
+                        self.link_titles_src8, self.link_titles_src1,
+                        self.link_titles_src11, self.link_titles_src13,
+                        self.link_titles_src12]))
         if clean_headlines:
-            self.link_titles_all = [item for item in self.link_titles_all if len(str(item).strip().split(' ')) > 3]
+            #More than three ' '-separated pieces == at least three spaces; counting skips building the split lists.
+            self.link_titles_all = [item for item in self.link_titles_all if str(item).strip().count(' ') > 2]
         ###############################################################################
         ###############################################################################
 
         ###############################################################################
         ###############################################################################
         #DataFrame with headlines, link titles, and sources.
-        self.links_for_df = self.link_titles_src1_for_df + self.link_titles_src3_for_df + \
-                self.link_titles_src4_for_df + self.link_titles_src5_for_df + \
-                self.link_titles_src5_for_df + self.link_titles_src6_for_df + \
-                self.link_titles_src7_for_df + self.link_titles_src8_for_df + \
-                self.link_titles_src9_for_df + self.link_titles_src10_for_df + \
-                self.link_titles_src11_for_df + \
-                self.link_titles_src12_for_df + self.link_titles_src13_for_df
-        self.links_df = pd.DataFrame(self.links_for_df, columns=['headline', 'link', 'source'])
+        self.links_for_df = list(chain.from_iterable([
+                self.link_titles_src1_for_df, self.link_titles_src2_for_df,
+                self.link_titles_src3_for_df, self.link_titles_src4_for_df,
+                self.link_titles_src5_for_df, self.link_titles_src6_for_df,
+                self.link_titles_src7_for_df, self.link_titles_src8_for_df,
+                self.link_titles_src9_for_df, self.link_titles_src10_for_df,
+                self.link_titles_src11_for_df, self.link_titles_src12_for_df,
+                self.link_titles_src13_for_df]))
+        #Build column-wise; the 13 repeated source labels are stored as categorical codes.
+        headlines, links, sources = (list(col) for col in zip(*self.links_for_df)) if self.links_for_df else ([], [], [])
+        self.links_df = pd.DataFrame({'headline': headlines, 'link': links, 'source': pd.Categorical(sources)})
         if clean_headlines:
-            self.links_df = self.links_df[self.links_df['headline'].apply(lambda x: len(str(x).strip().split(' ')) > 3)]
+            self.links_df = self.links_df[self.links_df['headline'].astype(str).str.strip().str.count(' ') > 2]
         ###############################################################################
         ###############################################################################
         
-    def process_headlines(self):
+    def process_headlines(self, tokenizer: str = "regex"):
         #Data Processing
-        self.tokenized_word = word_tokenize(' '.join(self.link_titles_all).lower())
-        self.filtered_words = []
-        stop_words_file = open(r"C:\Users\jdejo\OneDrive\Documents\Python_Folders\News_Web_Scraper\stopwords.txt", "r")
-        stop_words = stop_words_file.readlines()
-        stop_words_file.close()
-        stop_words_edited = []
-        for j in stop_words:
-            stop_words_edited.append(j.strip("\n"))
-        for word in self.tokenized_word:
-            if word not in stop_words_edited:
-                self.filtered_words.append(word)
-        self.ps = nltk.PorterStemmer()
-        self.stemmed_words =[]
-        for w in self.filtered_words:
-            self.stemmed_words.append(self.ps.stem(w))
-        self.lem = WordNetLemmatizer()
-        self.lemmed_words = []
-        for x in self.filtered_words:
-            self.lemmed_words.append(self.lem.lemmatize(x))
-        self.fdist_stem = FreqDist(self.stemmed_words)
-        self.fdist_stem_dict = dict(self.fdist_stem)
-        self.fdist_lem = FreqDist(self.lemmed_words)
-        self.fdist_lem_dict = dict(self.fdist_lem)
-
-
-        self.bigrams_lemmed = list(nltk.bigrams(self.lemmed_words))
-        self.bigrams_stemmed = list(nltk.bigrams(self.stemmed_words))
-        self.fdist_bigrams_lemmed = FreqDist(self.bigrams_lemmed)
-        self.fdist_bigrams_lemmed_dict = dict(self.fdist_bigrams_lemmed)
-        self.fdist_bigrams_stemmed = FreqDist(self.bigrams_stemmed)
-        self.fdist_bigrams_stemmed_dict = dict(self.fdist_bigrams_stemmed)
-
-        self.bigrams_lemmed_dict = {key:val for key, val in self.fdist_bigrams_lemmed_dict.items() if val > 3}
-        bi_stem = pd.DataFrame.from_dict(self.bigrams_lemmed_dict, orient='index').describe()
-
-        self.bigrams_stemmed_dict = {key:val for key, val in self.fdist_bigrams_stemmed_dict.items() if val > 3}
-        bi_lem = pd.DataFrame.from_dict(self.bigrams_stemmed_dict, orient='index').describe()
-
-
-        self.trigrams_lemmed = list(nltk.trigrams(self.lemmed_words))
-        self.trigrams_stemmed = list(nltk.trigrams(self.stemmed_words))
-        self.fdist_trigrams_lemmed = FreqDist(self.trigrams_lemmed)
-        self.fdist_trigrams_lemmed_dict = dict(self.fdist_trigrams_lemmed)
-        self.fdist_trigrams_stemmed = FreqDist(self.trigrams_stemmed)
-        self.fdist_trigrams_stemmed_dict = dict(self.fdist_trigrams_stemmed)
-
-        self.trigrams_lemmed_dict = {key:val for key, val in self.fdist_trigrams_lemmed_dict.items() if val > 3}
-        self.tri_lem = pd.DataFrame.from_dict(self.trigrams_lemmed_dict, orient='index').describe()
-
-        self.trigrams_stemmed_dict = {key:val for key, val in self.fdist_trigrams_stemmed_dict.items() if val > 3}
-        self.tri_stem = pd.DataFrame.from_dict(self.trigrams_stemmed_dict, orient='index').describe()
+        #Tokenize each distinct headline once; repeats reuse its tokens, so counts still reflect duplicates.
+        tokens_by_title = {title: tokenize_headlines(title.lower(), tokenizer) for title in dict.fromkeys(self.link_titles_all)}
+        self.tokenized_word = [token for title in self.link_titles_all for token in tokens_by_title[title]]
+        stop_words = load_stopwords()
+        self.filtered_words = [word for word in self.tokenized_word if word not in stop_words]
+        #Headlines repeat words heavily, so stem/lemmatize each distinct token once and map the rest.
+        unique_words = set(self.filtered_words)
+        #stem_word/lemmatize_word are memoized, so words seen in earlier runs cost a cache hit.
+        self.ps = _STEMMER
+        stems = {w: stem_word(w) for w in unique_words}
+        self.stemmed_words = list(map(stems.__getitem__, self.filtered_words))
+        self.lem = _LEMMATIZER
+        lemmas = {w: lemmatize_word(w) for w in unique_words}
+        self.lemmed_words = list(map(lemmas.__getitem__, self.filtered_words))
+        #Counter (a C-accelerated dict) replaces FreqDist; it is already a dict, so no dict() copies.
+        self.fdist_stem = Counter(self.stemmed_words)
+        self.fdist_stem_dict = self.fdist_stem
+        self.fdist_lem = Counter(self.lemmed_words)
+        self.fdist_lem_dict = self.fdist_lem
+
+
+        #N-grams are counted as they are generated; the tuple lists are never materialized.
+        self.fdist_bigrams_lemmed = ngram_counts(self.lemmed_words, 2)
+        self.fdist_bigrams_lemmed_dict = self.fdist_bigrams_lemmed
+        self.fdist_bigrams_stemmed = ngram_counts(self.stemmed_words, 2)
+        self.fdist_bigrams_stemmed_dict = self.fdist_bigrams_stemmed
+
+        self.bigrams_lemmed_dict = frequent_ngrams(self.fdist_bigrams_lemmed)
+        self.bigrams_stemmed_dict = frequent_ngrams(self.fdist_bigrams_stemmed)
+
+
+        self.fdist_trigrams_lemmed = ngram_counts(self.lemmed_words, 3)
+        self.fdist_trigrams_lemmed_dict = self.fdist_trigrams_lemmed
+        self.fdist_trigrams_stemmed = ngram_counts(self.stemmed_words, 3)
+        self.fdist_trigrams_stemmed_dict = self.fdist_trigrams_stemmed
+
+        self.trigrams_lemmed_dict = frequent_ngrams(self.fdist_trigrams_lemmed)
+        self.trigrams_stemmed_dict = frequent_ngrams(self.fdist_trigrams_stemmed)
 
         #The following function will find a word or sequence of words in link_titles_all.
         self.link_titles_all_set = set(self.link_titles_all)
+        #(headline, lower-cased headline) pairs so repeated lookups don't re-lowercase every headline.
+        self.link_titles_all_lower = [(item, item.lower()) for item in self.link_titles_all_set]
         
         #Sentiment analysis with nltk's VADER
-        self.sia = SentimentIntensityAnalyzer()
+        self.sia = sentiment_analyzer()
         #The following results will not be picklable for all lists that had the 
         #filter() function perfomed on them.
-        self.polarity_scores = {}
-        for item in self.link_titles_all:
-            self.polarity_scores[item] = self.sia.polarity_scores(item)
+        #Headlines repeat across sources; score each distinct one once (dict.fromkeys keeps first-seen order).
+        self.polarity_scores = score_headlines(list(dict.fromkeys(self.link_titles_all)))
         
     def symbol_news_polygon(self, symbol: str, from_date: str, limit: int = 10) -> list[str]:
         client = RESTClient(polygon_api_key)
@@ -1,6 +1,8 @@
 import asyncio
 import contextlib
 import json
+import pickle
+import re
 import signal
 import sys
 import os
@@ -8,8 +10,40 @@ import websockets
 from colorama import init, Fore, Style
 init(autoreset=True)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except Exception:
+    _json_loads = json.loads
+
+try:
+    import msgspec
+
+    # Only str fields, so instances can't form reference cycles; gc=False keeps them
+    # out of the cyclic GC, which matters in a long-running stream.
+    class Filing(msgspec.Struct, gc=False):
+        ticker: str = ""
+        formType: str = ""
+        filedAt: str = ""
+        linkToFilingDetails: str = ""
+
+    # Typed decoder for the common case (a list of filings); anything else falls
+    # back to a generic decode below.
+    _FILINGS_DECODER = msgspec.json.Decoder(list[Filing])
+    _HAVE_MSGSPEC = True
+except Exception:
+    _HAVE_MSGSPEC = False
+
 DEFAULT_SYMBOLS_LOCATION = r"E:\Market Research\Studies\Sector Studies\Watchlists\High_AvgDV.txt"
 DEFAULT_SECTORS_INDUSTRIES_PATH = r"E:\Market Research\Dataset\Fundamental Data\symbol_sector_industry.txt"
+# Received frames buffered between the websocket reader and the dispatcher.
+MESSAGE_QUEUE_SIZE = 1000
+# Most frames the consumer handles before yielding back to the event loop.
+CONSUMER_BATCH_SIZE = 100
+# Parsed metadata, reused across process starts until either source file changes.
+METADATA_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "news_tracker", "meta.pkl")
+# Bump when the shape of the cached metadata changes so stale pickles are ignored.
+METADATA_CACHE_VERSION = 2
 
 # Ensure project root is on sys.path when running "python scripts\filings_stream.py"
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -18,6 +52,9 @@ if PROJECT_ROOT not in sys.path:
 
 from api_keys import sec_api_key
 
+# ANSI prefix for each color name produced by build_ticker_color (CLI output only).
+_COLOR_PREFIX = {"green": Fore.GREEN, "yellow": Fore.YELLOW, "default": ""}
+
 # Fill this in (you said you'll handle security after)
 API_KEY = sec_api_key
 WS_URL = f"wss://stream.sec-api.io?apiKey={API_KEY}"
@@ -25,43 +62,130 @@ WS_URL = f"wss://stream.sec-api.io?apiKey={API_KEY}"
 def load_symbol_metadata(
     symbols_location: str = DEFAULT_SYMBOLS_LOCATION,
     sectors_industries_path: str = DEFAULT_SECTORS_INDUSTRIES_PATH,
-) -> tuple[list[str], dict, set]:
+) -> tuple[frozenset[str], dict, set, dict[str, str]]:
     """
     Load your watchlist and sector/industry metadata used for filtering + coloring.
 
     Returns:
-      (symbols, sectors_industries, banking_industries)
+      (symbols, sectors_industries, banking_industries, ticker_color)
 
     Notes:
     - This is best-effort: if files are missing/unreadable, returns empty structures.
     - Keeping this out of module import time makes the module safe to import from a GUI.
+    - Results are pickled to METADATA_CACHE_PATH keyed by both paths + mtimes, so later
+      starts skip re-parsing until either file changes.
     """
+    try:
+        cache_key = (
+            METADATA_CACHE_VERSION,
+            symbols_location,
+            os.path.getmtime(symbols_location),
+            sectors_industries_path,
+            os.path.getmtime(sectors_industries_path),
+        )
+    except OSError:
+        cache_key = None  # A file is missing; don't cache the empty fallback.
+
+    if cache_key is not None:
+        try:
+            with open(METADATA_CACHE_PATH, "rb") as f:
+                cached_key, cached = pickle.load(f)
+            if cached_key == cache_key:
+                return cached
+        except Exception:
+            pass
+
     try:
         with open(symbols_location, "r", encoding="utf-8") as f:
-            symbols = [ln.strip() for ln in f.readlines() if ln.strip()]
+            symbols = frozenset(s for ln in f if (s := ln.strip()))
     except Exception:
-        symbols = []
+        symbols = frozenset()
 
     try:
-        with open(sectors_industries_path, "r", encoding="utf-8") as f:
-            sectors_industries = json.load(f)
+        with open(sectors_industries_path, "rb") as f:
+            sectors_industries = _json_loads(f.read())
     except Exception:
         sectors_industries = {}
 
-    banking_industries = set()
     try:
-        for sym in symbols:
-            meta = sectors_industries.get(sym)
-            if not isinstance(meta, dict):
-                continue
-            if meta.get("sector") == "Financial Services":
-                ind = meta.get("industry")
-                if ind:
-                    banking_industries.add(ind)
+        banking_industries = {
+            meta["industry"]
+            for sym in symbols
+            if isinstance(meta := sectors_industries.get(sym), dict)
+            and meta.get("sector") == "Financial Services"
+            and meta.get("industry")
+        }
     except Exception:
         banking_industries = set()
 
-    return symbols, sectors_industries, banking_industries
+    ticker_color = build_ticker_color(sectors_industries, banking_industries)
+    result = (symbols, sectors_industries, banking_industries, ticker_color)
+
+    if cache_key is not None:
+        try:
+            os.makedirs(os.path.dirname(METADATA_CACHE_PATH), exist_ok=True)
+            with open(METADATA_CACHE_PATH, "wb") as f:
+                pickle.dump((cache_key, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            pass
+
+    return result
+
+
+def build_ticker_color(sectors_industries: dict, banking_industries: set) -> dict[str, str]:
+    """
+    Precompute the display color for every ticker with sector/industry metadata.
+
+    Tickers missing from the result should be treated as "yellow" (unknown sector).
+    """
+    ticker_color = {}
+    for sym, meta in sectors_industries.items():
+        if not isinstance(meta, dict):
+            ticker_color[sym] = "default"
+        elif meta.get("industry") not in banking_industries:
+            ticker_color[sym] = "green"
+        else:
+            ticker_color[sym] = "default"
+    return ticker_color
+
+
+# Raw-text views of a frame for the pre-parse watchlist check (frames may arrive as str or bytes).
+_LIST_FRAME_RE = re.compile(r"\s*\[")
+_LIST_FRAME_RE_B = re.compile(rb"\s*\[")
+_TICKER_FIELD_RE = re.compile(r'"ticker"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_TICKER_FIELD_RE_B = re.compile(rb'"ticker"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def _may_match_watchlist(msg, symbols: frozenset[str]) -> bool:
+    """
+    Cheap check run before parsing a frame (filter before you parse).
+
+    Returns False only when the frame is a list of filings and none of its raw
+    "ticker" values is in `symbols`; anything else (status messages, escaped
+    tickers) is left for the full decode.
+    """
+    if isinstance(msg, (bytes, bytearray)):
+        if not _LIST_FRAME_RE_B.match(msg):
+            return True
+        tickers = _TICKER_FIELD_RE_B.findall(msg)
+        if any(b"\\" in t for t in tickers):
+            return True
+        return not symbols.isdisjoint(t.decode("utf-8", "replace") for t in tickers)
+    if not _LIST_FRAME_RE.match(msg):
+        return True
+    tickers = _TICKER_FIELD_RE.findall(msg)
+    if any("\\" in t for t in tickers):
+        return True
+    return not symbols.isdisjoint(tickers)
+
+
+# Trailing UTC offset on filedAt (e.g. -05:00, or -04:00 during daylight saving time).
+_TZ_SUFFIX_RE = re.compile(r"[-+]\d{2}:\d{2}$")
+
+
+def normalize_filed_at(filed_at: str) -> str:
+    """Format an ISO filedAt timestamp for display: 'YYYY-MM-DD HH:MM:SS' without the UTC offset."""
+    return _TZ_SUFFIX_RE.sub("", filed_at.replace("T", " ", 1))
 
 
 stop_event = asyncio.Event()
@@ -73,9 +197,10 @@ def _request_stop(*_args):
 
 async def stream_filings(
     *,
-    symbols: list[str] | None = None,
+    symbols: frozenset[str] | list[str] | None = None,
     sectors_industries: dict | None = None,
     banking_industries: set | None = None,
+    ticker_color: dict[str, str] | None = None,
     on_log=None,
     on_filing=None,
     stop: asyncio.Event | None = None,
@@ -87,16 +212,31 @@ async def stream_filings(
     - `on_log(line: str)` receives human-readable status lines.
     - `on_filing(payload: dict)` receives structured filing events with keys:
         ticker, form_type, filed_at, link, color
+    - `ticker_color` maps ticker -> color (see `build_ticker_color`); derived from
+      `sectors_industries`/`banking_industries` when not provided.
     - `stop` is an asyncio.Event used to request shutdown (defaults to module `stop_event`).
     """
     stop_evt = stop or stop_event
-    symbols_set = set(symbols or [])
+    symbols_set = frozenset(symbols or ())
     sectors_industries = sectors_industries or {}
     banking_industries = banking_industries or set()
+    if ticker_color is None:
+        ticker_color = build_ticker_color(sectors_industries, banking_industries)
     # If a structured filing callback is provided (GUI usage), avoid also emitting
     # the CLI-friendly colored log lines for each filing (prevents duplicates + ANSI codes).
     emit_cli_filing_logs = on_filing is None
 
+    # Console lines are collected here and written with one stdout write per consumer batch
+    # instead of a print() (lock + encode + flush) per line.
+    stdout_lines: list[str] = []
+    batching = False
+
+    def _flush_stdout() -> None:
+        if stdout_lines:
+            sys.stdout.write("".join(stdout_lines))
+            sys.stdout.flush()
+            stdout_lines.clear()
+
     def _log(line: str) -> None:
         if on_log is not None:
             try:
@@ -105,73 +245,153 @@ async def stream_filings(
             except Exception:
                 # Fall back to printing if callback fails.
                 pass
-        print(line)
+        # Reset per line: colorama's autoreset only fires once per write, and a batch is one write.
+        stdout_lines.append(f"{line}{Style.RESET_ALL}\n")
+        if not batching:
+            _flush_stdout()
+
+    def _handle_message(msg) -> None:
+        """Decode one websocket frame and dispatch every filing it contains."""
+        if symbols_set and not _may_match_watchlist(msg, symbols_set):
+            return
+        rows = None
+        if _HAVE_MSGSPEC:
+            try:
+                rows = [
+                    (f.ticker, f.formType, f.filedAt, f.linkToFilingDetails)
+                    for f in _FILINGS_DECODER.decode(msg)
+                ]
+            except msgspec.ValidationError:
+                # Valid JSON but not a list of filings; decode generically below.
+                rows = None
+            except msgspec.DecodeError:
+                _log(f"[WARN] Non-JSON message: {msg!r}")
+                return
+
+        if rows is None:
+            try:
+                data = _json_loads(msg)
+            except ValueError:
+                _log(f"[WARN] Non-JSON message: {msg!r}")
+                return
+
+            if not isinstance(data, list):
+                # Just print whatever came back
+                _log(json.dumps(data, indent=2))
+                return
+
+            # The browser example expects a list of filings
+            rows = [
+                (
+                    filing.get("ticker", ""),
+                    filing.get("formType", ""),
+                    filing.get("filedAt", ""),
+                    filing.get("linkToFilingDetails", ""),
+                )
+                for filing in data
+            ]
+
+        for ticker, form_type, filed_at, link in rows:
+            if symbols_set and ticker not in symbols_set:
+                continue
+            filed_at = normalize_filed_at(filed_at)
+
+            color = ticker_color.get(ticker, "yellow")
+
+            # Emit structured event (preferred for GUI).
+            payload = {
+                "ticker": ticker,
+                "form_type": form_type,
+                "filed_at": filed_at,
+                "link": link,
+                "color": color,
+            }
+            if on_filing is not None:
+                try:
+                    on_filing(payload)
+                except Exception:
+                    pass
+
+            # Also log in a CLI-friendly way (CLI usage only).
+            if emit_cli_filing_logs:
+                _log(f"{_COLOR_PREFIX.get(color, '')}{ticker}: {form_type}, {filed_at},\n {Fore.BLUE}{link}")
+
+    # Frames dropped because the queue was full, reported by _report_drops() as one summary line.
+    dropped = 0
+
+    def _report_drops() -> None:
+        nonlocal dropped
+        if dropped:
+            _log(f"[WARN] Filing queue full; dropped {dropped} oldest pending message(s).")
+            dropped = 0
+
+    def _handle_batch(batch) -> None:
+        nonlocal batching
+        batching = True
+        try:
+            for msg in batch:
+                try:
+                    _handle_message(msg)
+                except Exception as e:
+                    # Keep consuming; one malformed filing shouldn't stall the whole feed.
+                    _log(f"[ERROR] Failed to handle message: {e}")
+        finally:
+            batching = False
+            _flush_stdout()
+
+    async def _consume(queue: asyncio.Queue) -> None:
+        while True:
+            # Wait for one frame, then drain whatever else is already queued so a burst
+            # is handled as one batch instead of one scheduler round-trip per frame.
+            batch = [await queue.get()]
+            while len(batch) < CONSUMER_BATCH_SIZE:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            _handle_batch(batch)
+            if queue.empty():
+                # Caught up: report any overload drops once rather than per frame.
+                _report_drops()
+            # Callbacks are synchronous; yield between batches so recv and keepalive pings keep running.
+            await asyncio.sleep(0)
 
     backoff_s = 1
 
     while not stop_evt.is_set():
         try:
             _log(f"Connecting to Stream API")
-            async with websockets.connect(WS_URL, ping_interval=20, ping_timeout=20) as ws:
+            # Frames are small JSON batches, so skip permessage-deflate (no per-frame inflate,
+            # smaller per-connection buffers); allow up to 4 MiB for large bursts.
+            async with websockets.connect(
+                WS_URL, ping_interval=20, ping_timeout=20, compression=None, max_size=2**22
+            ) as ws:
                 _log("Connected. Awaiting new filings... (Ctrl+C to stop)")
                 backoff_s = 1  # reset after successful connect
 
-                while not stop_evt.is_set():
-                    msg = await ws.recv()
-
-                    try:
-                        data = json.loads(msg)
-                    except json.JSONDecodeError:
-                        _log(f"[WARN] Non-JSON message: {msg!r}")
-                        continue
-
-                    # The browser example expects a list of filings
-                    if isinstance(data, list):
-                        for filing in data:
-                            ticker = filing.get("ticker", "")
-                            if symbols_set and ticker not in symbols_set:
-                                continue
-                            form_type = filing.get("formType", "")
-                            filed_at = filing.get("filedAt", "").replace("T", " ").replace("-05:00", "")
-                            link = filing.get("linkToFilingDetails", "")
-
-                            color = "default"
-                            try:
-                                if (
-                                    (ticker in sectors_industries)
-                                    and (sectors_industries[ticker].get("industry") not in banking_industries)
-                                ):
-                                    color = "green"
-                                elif ticker not in sectors_industries:
-                                    color = "yellow"
-                            except Exception:
-                                color = "default"
-
-                            # Emit structured event (preferred for GUI).
-                            payload = {
-                                "ticker": ticker,
-                                "form_type": form_type,
-                                "filed_at": filed_at,
-                                "link": link,
-                                "color": color,
-                            }
-                            if on_filing is not None:
-                                try:
-                                    on_filing(payload)
-                                except Exception:
-                                    pass
-
-                            # Also log in a CLI-friendly way (CLI usage only).
-                            if emit_cli_filing_logs:
-                                if color == "green":
-                                    _log(Fore.GREEN + f"{ticker}: {form_type}, {filed_at},\n {Fore.BLUE}{link}")
-                                elif color == "yellow":
-                                    _log(Fore.YELLOW + f"{ticker}: {form_type}, {filed_at},\n {Fore.BLUE}{link}")
-                                else:
-                                    _log(f"{ticker}: {form_type}, {filed_at},\n {Fore.BLUE}{link}")
-                    else:
-                        # Just print whatever came back
-                        _log(json.dumps(data, indent=2))
+                # Producer/consumer split: this loop only receives, so a slow on_filing callback
+                # can no longer hold up ws.recv() (and trip the keepalive timeout) during bursts.
+                queue: asyncio.Queue = asyncio.Queue(maxsize=MESSAGE_QUEUE_SIZE)
+                consumer = asyncio.create_task(_consume(queue))
+                try:
+                    while not stop_evt.is_set():
+                        msg = await ws.recv()
+                        if queue.full():
+                            # Prefer latency over completeness: drop the oldest pending frame.
+                            queue.get_nowait()
+                            dropped += 1
+                        queue.put_nowait(msg)
+                finally:
+                    consumer.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await consumer
+                    if not stop_evt.is_set():
+                        # Dispatch frames that arrived before the connection dropped.
+                        leftover = []
+                        while not queue.empty():
+                            leftover.append(queue.get_nowait())
+                        _handle_batch(leftover)
+                    _report_drops()
 
         except asyncio.CancelledError:
             return
@@ -199,12 +419,14 @@ async def main():
     if hasattr(signal, "SIGTERM"):
         signal.signal(signal.SIGTERM, _request_stop)
 
-    symbols, sectors_industries, banking_industries = load_symbol_metadata()
+    # File reads/parsing run in a worker thread so they never block the event loop.
+    symbols, sectors_industries, banking_industries, ticker_color = await asyncio.to_thread(load_symbol_metadata)
     task = asyncio.create_task(
         stream_filings(
             symbols=symbols,
             sectors_industries=sectors_industries,
             banking_industries=banking_industries,
+            ticker_color=ticker_color,
             stop=stop_event,
         )
     )
@@ -214,5 +436,22 @@ async def main():
         await task
 
 
+def _run(coro):
+    """Run `coro` on uvloop (POSIX) / winloop (Windows) when installed, else the default loop."""
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        return asyncio.run(coro)
+    run = getattr(fast_loop, "run", None)
+    if run is not None:
+        return run(coro)
+    # Older uvloop (< 0.18) / winloop releases only offer install().
+    fast_loop.install()
+    return asyncio.run(coro)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    _run(main())
\ No newline at end of file
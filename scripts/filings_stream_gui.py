@@ -65,7 +65,7 @@ if _PROJECT_ROOT not in sys.path:
 
 GUI_FEED_LOG_PATH = os.path.join(_PROJECT_ROOT, "filings_stream_gui_log.jsonl")
 
-from scripts.filings_stream import load_symbol_metadata, stream_filings
+from scripts.filings_stream import load_symbol_metadata, normalize_filed_at, stream_filings
 from api_keys import open_ai as oai_key
 from x import Post_Constructor, post_scheduler, scheduled_post
 
@@ -138,7 +138,7 @@ class StreamWorker(QThread):
         self._loop = loop
         self._stop_evt = asyncio.Event()
 
-        symbols, sectors_industries, banking_industries = load_symbol_metadata()
+        symbols, sectors_industries, banking_industries, ticker_color = load_symbol_metadata()
 
         def on_log(line: str) -> None:
             self.log_line.emit(line)
@@ -153,6 +153,7 @@ class StreamWorker(QThread):
                     symbols=symbols,
                     sectors_industries=sectors_industries,
                     banking_industries=banking_industries,
+                    ticker_color=ticker_color,
                     on_log=on_log,
                     on_filing=on_filing,
                     stop=self._stop_evt,
@@ -239,7 +240,7 @@ class PrefetchSinceMidnightWorker(QThread):
         start_z = self._utc_z(local_start)
         end_z = self._utc_z(local_now)
 
-        symbols, sectors_industries, banking_industries = load_symbol_metadata()
+        symbols, _sectors_industries, _banking_industries, ticker_color = load_symbol_metadata()
         symbols_set = set([s.strip().upper() for s in (symbols or []) if str(s).strip()])
 
         # Batch tickers to keep Lucene queries reasonably sized.
@@ -315,20 +316,10 @@ class PrefetchSinceMidnightWorker(QThread):
 
                 form_type = str(filing.get("formType", "") or "")
                 filed_at_raw = str(filing.get("filedAt", "") or "")
-                filed_at = filed_at_raw.replace("T", " ").replace("-05:00", "")
+                filed_at = normalize_filed_at(filed_at_raw)
                 link = str(filing.get("linkToFilingDetails", "") or "")
 
-                color = "default"
-                try:
-                    t = ticker.strip().upper()
-                    if (t in sectors_industries) and (
-                        sectors_industries[t].get("industry") not in banking_industries
-                    ):
-                        color = "green"
-                    elif t not in sectors_industries:
-                        color = "yellow"
-                except Exception:
-                    color = "default"
+                color = ticker_color.get(ticker.strip().upper(), "yellow")
 
                 payload = {
                     "ticker": ticker,
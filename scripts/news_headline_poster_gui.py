@@ -197,7 +197,9 @@ def retrieve_symbol_headlines(symbol: str) -> pd.DataFrame:
         raise ValueError("symbol must be non-empty")
     engine = create_engine(NEWS_DB_URL, pool_pre_ping=True, connect_args={"connect_timeout": 5})
     # Use backticks to avoid issues with table names that collide with keywords.
-    return pd.read_sql(f"SELECT * FROM `{sym}`", con=engine)
+    df = pd.read_sql(f"SELECT * FROM `{sym}`", con=engine)
+    # Url_hash is the controller's internal dedup key (binary); not a display column.
+    return df.drop(columns="Url_hash", errors="ignore")
 
 
 class NewsHeadlinePosterApp:
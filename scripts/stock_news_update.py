@@ -34,7 +34,6 @@ def main():
     try:
         while True:
             if (time.monotonic() - start) >= max_runtime_seconds:
-                controller._save_queue()
                 print(f"\nTime limit reached (4 hours). Progress saved at {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
                 return 0
             controller._assign_skip_status()
@@ -42,12 +41,16 @@ def main():
             if not symbols:
                 break
             controller.store_symbol_news(symbols)
-            controller._save_queue()
+            # Only writes if the queue changed and the flush interval has passed; exits force a save.
+            controller._save_queue(force=False)
     except KeyboardInterrupt:
-        # Ctrl+C: persist progress and exit cleanly.
-        controller._save_queue()
+        # Ctrl+C: exit cleanly (progress is persisted below).
         print("\nStopped by user (Ctrl+C). Progress saved.")
         return 0
+    finally:
+        # Forced save on every exit path, including errors, so up to one flush
+        # interval of queue progress isn't lost.
+        controller._save_queue()
     return 0
 
 if __name__ == "__main__":
@@ -32,14 +32,15 @@ class UserInterface(NewsImporter):
         super().__init__()
         
     def find_headline(self, word, regex=False, check_dataframe=False, save_dataframe=False):
-        self.headlines = []
-        for item in self.link_titles_all_set:
-            if regex==False:
-                if word in item.lower():
-                    self.headlines.append((len(self.headlines), item.strip()))
-            elif regex==True:
-                if re.findall(word, item.lower()):
-                    self.headlines.append((len(self.headlines), item.strip()))
+        if regex:
+            #Compile once; .search stops at the first match instead of building a findall list.
+            pattern = re.compile(word)
+            matches = (item for item, lowered in self.link_titles_all_lower if pattern.search(lowered))
+        else:
+            matches = (item for item, lowered in self.link_titles_all_lower if word in lowered)
+        self.headlines = [(i, item.strip()) for i, item in enumerate(matches)]
+        #Row label for tagged headlines; date.today() is already the date pd.to_datetime(...).date() produced.
+        today = datetime.date.today()
         if save_dataframe:
             tagpath = fr"E:\Market Research\Dataset\News\Market News\tags\{word}" 
             if not os.path.exists(tagpath):
@@ -47,12 +48,12 @@ class UserInterface(NewsImporter):
             framepath = fr"E:\Market Research\Dataset\News\Market News\tags\{word}\dataframe.txt"
             if not os.path.exists(framepath):
                 df = pd.DataFrame(data=[item[1] for item in self.find_headline(word)])
-                df.index = [pd.to_datetime(datetime.date.today()).date()] * len(df)
+                df.index = [today] * len(df)
                 df.columns = ['headlines']
                 df.to_csv(framepath)
             else:
-                df = pd.read_csv(framepath, index_col='Unnamed: 0')
-                df2 = pd.DataFrame(data=[item[1] for item in self.headlines], index = [pd.to_datetime(datetime.date.today()).date()] * len(self.headlines))
+                df = pd.read_csv(framepath, index_col=0)
+                df2 = pd.DataFrame(data=[item[1] for item in self.headlines], index = [today] * len(self.headlines))
                 df2.columns = ['headlines']
                 df3 = pd.concat([df, df2], axis=0)
                 df3.drop_duplicates(inplace=True)
@@ -68,8 +69,8 @@ class UserInterface(NewsImporter):
             if not os.path.exists(framepath):
                 print('No Tag Dataframe')
                 return self.headlines
-            df = pd.read_csv(framepath, index_col='Unnamed: 0')
-            df2 = pd.DataFrame(data=[item[1] for item in self.headlines], index = [pd.to_datetime(datetime.date.today()).date()] * len(self.headlines))
+            df = pd.read_csv(framepath, index_col=0)
+            df2 = pd.DataFrame(data=[item[1] for item in self.headlines], index = [today] * len(self.headlines))
             df2.columns = ['headlines']
             df3 = pd.concat([df, df2], axis=0)
             df3.drop_duplicates(inplace=True)
@@ -203,10 +204,7 @@ class UserInterface(NewsImporter):
                     pprint(self.find_headline(tag, check_dataframe=True))
 
     def ngram_headline_polarity_scores(self, ngram):
-        headlines = []
-        for item in self.link_titles_all_set:
-            if ngram in item.lower():
-                headlines.append(item.strip())
+        headlines = [item.strip() for item, lowered in self.link_titles_all_lower if ngram in lowered]
         for headline in headlines:
             polarity_scores[headline] = sia.polarity_scores(headline)
 
@@ -233,17 +231,15 @@ class UserInterface(NewsImporter):
         driver.close()
     
     def ngrams_frame(self):
-        mono_ngrams = [item[0] for item in sorted(self.fdist_stem_dict.items(), key=lambda x: x[1], reverse=True)]
+        #Counter.most_common() sorts each table once (same order as sorted(..., reverse=True)); zip splits the pairs.
+        mono_ngrams, mono_n = zip(*self.fdist_stem.most_common()) if self.fdist_stem else ((), ())
         mono_ngrams_series = pd.Series(mono_ngrams, name='ngrams')
-        mono_n = [item[1] for item in sorted(self.fdist_stem_dict.items(), key=lambda x: x[1], reverse=True)]
         mono_n_series = pd.Series(mono_n, name='n')
-        bi_ngrams = [item[0] for item in sorted(self.fdist_bigrams_stemmed_dict.items(), key=lambda x: x[1], reverse=True)]
+        bi_ngrams, bi_n = zip(*self.fdist_bigrams_stemmed.most_common()) if self.fdist_bigrams_stemmed else ((), ())
         bi_ngrams_series = pd.Series(bi_ngrams, name='ngrams')
-        bi_n = [item[1] for item in sorted(self.fdist_bigrams_stemmed_dict.items(), key=lambda x: x[1], reverse=True)]
         bi_n_series = pd.Series(bi_n, name='n')
-        tri_ngrams = [item[0] for item in sorted(self.fdist_trigrams_stemmed_dict.items(), key=lambda x: x[1], reverse=True)]
+        tri_ngrams, tri_n = zip(*self.fdist_trigrams_stemmed.most_common()) if self.fdist_trigrams_stemmed else ((), ())
         tri_ngrams_series = pd.Series(tri_ngrams, name='ngrams')
-        tri_n = [item[1] for item in sorted(self.fdist_trigrams_stemmed_dict.items(), key=lambda x: x[1], reverse=True)]
         tri_n_series = pd.Series(tri_n, name='n')
         df = pd.concat([mono_ngrams_series, mono_n_series, bi_ngrams_series, bi_n_series, tri_ngrams_series, tri_n_series],  axis=1)
         df.columns = pd.MultiIndex.from_tuples((('mono', 'ngrams'), ('mono', 'n'),('bi', 'ngrams'), ('bi', 'n'), ('tri', 'ngrams'), ('tri', 'n')))
@@ -1,30 +1,80 @@
-from urllib.request import Request, urlopen
+import os
+from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup as bs
 from api_keys import finviz_api_key
 
+try:
+    import lxml  # noqa: F401
 
-def basic_bsoup(url):
+    _HAVE_LXML = True
+except Exception:
+    _HAVE_LXML = False
+
+#On-disk HTTP cache for scraped pages is opt-in: set NEWS_TRACKER_HTTP_CACHE=1 (needs requests-cache).
+HTTP_CACHE_ENABLED = os.environ.get('NEWS_TRACKER_HTTP_CACHE', '').strip().lower() in ('1', 'true', 'yes')
+
+_HAVE_REQUESTS_CACHE = False
+if HTTP_CACHE_ENABLED:
+    try:
+        import requests_cache
+
+        _HAVE_REQUESTS_CACHE = True
+    except Exception:
+        _HAVE_REQUESTS_CACHE = False
+
+#lxml's compiled tree builder parses much faster than the pure-Python html.parser.
+_BSOUP_PARSER = 'lxml' if _HAVE_LXML else 'html.parser'
+
+#Seconds a cached page may be reused without asking the server when it sends no Cache-Control of
+#its own. 0 means every request is revalidated (If-None-Match/If-Modified-Since), so an unchanged
+#page costs a 304 with no body but a changed page is never served stale.
+HTTP_CACHE_EXPIRE_SECONDS = 0
+
+#One keep-alive session for all scrapers so repeat requests to a host skip the TCP/TLS handshake.
+#With the HTTP cache enabled (and requests-cache installed), pages also go through a SQLite cache
+#next to this module; server Cache-Control headers take precedence over HTTP_CACHE_EXPIRE_SECONDS.
+if _HAVE_REQUESTS_CACHE:
+    _SESSION = requests_cache.CachedSession(
+        str(Path(__file__).resolve().with_name('news_cache')),
+        backend='sqlite',
+        expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+        cache_control=True,
+        allowable_methods=('GET',),
+    )
+else:
+    _SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'Brave/1.32.113'}) #Masks the bot as presents it to the server as a web browser
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3))
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+
+
+def basic_bsoup(url, session=None):
     """This is a basic web scraper and will gather the soup from the specified url.
     It will return the bsoup variable which can be used with .findAll() or a 
     related function to find the desired elements on the webpage.
     A variable will need to be created to store the elements that are found.
     The following packages will need to be imported:
         from bs4 import beautifulSoup
-        from urllib.request import Request, urlopen
+        import requests
+    Pages are fetched through a shared requests.Session (module-level _SESSION) unless
+    another session is passed, e.g. a CachedSession with different expiry settings.
+    lxml is used as the parser when it is installed, otherwise html.parser.
     """
     site_link = url
-    req = Request(site_link, headers={'User-Agent': 'Brave/1.32.113'}) #Masks the bot as presents it to the server as a web browser
-    webpage = urlopen(req).read() #This obtains/reads the webpage/html.
-    basic_bsoup.bsoup = bs(webpage, 'html.parser')
-    return basic_bsoup.bsoup
+    response = (session or _SESSION).get(site_link, timeout=10) #This obtains/reads the webpage/html.
+    response.raise_for_status() #urlopen raised on HTTP errors; keep that behavior.
+    webpage = response.content
+    soup = bs(webpage, _BSOUP_PARSER)
+    basic_bsoup.bsoup = soup #Kept for callers that read the last soup; return the local so concurrent calls can't swap results.
+    return soup
 
 def flatten_list(list_to_flatten):
-    """Another 'flattened' list will need to be made outsde of this function """
-    flatten_list.flattened = []
-    for sublist in list_to_flatten:
-        for val in sublist:
-            flatten_list.flattened.append(val)
-    return flatten_list.flattened
+    """Return a new list with one level of nesting removed (no state is kept on the function)."""
+    return [val for sublist in list_to_flatten for val in sublist]
 
 finviz_api_urls = {
     "news_only": f"https://elite.finviz.com/news_export.ashx?c=1&auth={finviz_api_key}",